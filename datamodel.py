@@ -1,7 +1,6 @@
+from __future__ import annotations
 import json
-from typing import Dict, List
 from json import JSONEncoder
-import jsonpickle
 
 Time = int
 Symbol = str
@@ -33,12 +32,12 @@ class ConversionObservation:
 
 class Observation:
 
-    def __init__(self, plainValueObservations: Dict[Product, ObservationValue], conversionObservations: Dict[Product, ConversionObservation]) -> None:
+    def __init__(self, plainValueObservations: dict[Product, ObservationValue], conversionObservations: dict[Product, ConversionObservation]) -> None:
         self.plainValueObservations = plainValueObservations
         self.conversionObservations = conversionObservations
 
     def __str__(self) -> str:
-        return "(plainValueObservations: " + jsonpickle.encode(self.plainValueObservations) + ", conversionObservations: " + jsonpickle.encode(self.conversionObservations) + ")"
+        return "(plainValueObservations: " + json.dumps(self.plainValueObservations, cls=ProsperityEncoder) + ", conversionObservations: " + json.dumps(self.conversionObservations, cls=ProsperityEncoder) + ")"
 
 
 class Order:
@@ -58,8 +57,8 @@ class Order:
 class OrderDepth:
 
     def __init__(self):
-        self.buy_orders: Dict[int, int] = {}
-        self.sell_orders: Dict[int, int] = {}
+        self.buy_orders: dict[int, int] = {}
+        self.sell_orders: dict[int, int] = {}
 
 
 class Trade:
@@ -84,11 +83,11 @@ class TradingState(object):
     def __init__(self,
                  traderData: str,
                  timestamp: Time,
-                 listings: Dict[Symbol, Listing],
-                 order_depths: Dict[Symbol, OrderDepth],
-                 own_trades: Dict[Symbol, List[Trade]],
-                 market_trades: Dict[Symbol, List[Trade]],
-                 position: Dict[Product, Position],
+                 listings: dict[Symbol, Listing],
+                 order_depths: dict[Symbol, OrderDepth],
+                 own_trades: dict[Symbol, list[Trade]],
+                 market_trades: dict[Symbol, list[Trade]],
+                 position: dict[Product, Position],
                  observations: Observation):
         self.traderData = traderData
         self.timestamp = timestamp
@@ -0,0 +1,202 @@
+import csv
+import json
+import os
+import sys
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+
+TRUNCATION_MARKER = "..."
+LAMBDA_LOG_KEY = '"lambdaLog":'
+ACTIVITIES_HEADER = "Activities log:"
+TRADE_HISTORY_HEADER = "Trade History:"
+
+
+class Table:
+    def __init__(self, columns: List[str]) -> None:
+        self.columns = columns
+        self.data: Dict[str, list] = {column: [] for column in columns}
+
+    def __len__(self) -> int:
+        return len(self.data[self.columns[0]])
+
+    def append(self, *row: Any) -> None:
+        for column, value in zip(self.columns, row):
+            self.data[column].append(value)
+
+    def to_numpy(self) -> Dict[str, Any]:
+        # numpy is only needed by callers that ask for arrays, so import it lazily
+        import numpy as np
+
+        return {column: np.asarray(values) for column, values in self.data.items()}
+
+    def write_csv(self, path: str) -> None:
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(self.columns)
+            writer.writerows(zip(*(self.data[column] for column in self.columns)))
+
+
+class LogParser:
+    """Streams a submission log into columnar tables.
+
+    Understands both the sandbox blocks of an exchange log (where each
+    "lambdaLog" holds one Logger.flush line) and raw Logger.flush lines
+    printed by a local run, plus the semicolon separated activities CSV.
+    """
+
+    def __init__(self) -> None:
+        self.orders = Table(["timestamp", "symbol", "price", "quantity"])
+        self.own_trades = Table(["timestamp", "symbol", "price", "quantity", "buyer", "seller", "trade_timestamp"])
+        self.market_trades = Table(["timestamp", "symbol", "price", "quantity", "buyer", "seller", "trade_timestamp"])
+        self.positions = Table(["timestamp", "product", "position"])
+        self.books = Table(["timestamp", "symbol", "side", "price", "volume"])
+        self.logs = Table(["timestamp", "conversions", "trader_data", "logs", "truncated"])
+        self.activities: Optional[Table] = None
+        self.skipped = 0
+
+    def tables(self) -> Dict[str, Table]:
+        tables = {
+            "orders": self.orders,
+            "own_trades": self.own_trades,
+            "market_trades": self.market_trades,
+            "positions": self.positions,
+            "books": self.books,
+            "logs": self.logs,
+        }
+        if self.activities is not None:
+            tables["activities"] = self.activities
+
+        return tables
+
+    def parse_file(self, path: str) -> "LogParser":
+        with open(path, "r") as f:
+            self.parse_lines(f)
+
+        return self
+
+    def parse_lines(self, lines: Iterable[str]) -> "LogParser":
+        in_activities = False
+        for line in lines:
+            stripped = line.strip()
+
+            if in_activities:
+                if not stripped or stripped.startswith(TRADE_HISTORY_HEADER):
+                    # blank lines only end the section once its header row has been read
+                    in_activities = self.activities is None and not stripped
+                    continue
+                self.parse_activity_line(stripped)
+                continue
+
+            if stripped.startswith(LAMBDA_LOG_KEY):
+                self.parse_lambda_log(stripped[len(LAMBDA_LOG_KEY):].strip().rstrip(","))
+            elif stripped.startswith("[["):
+                self.parse_flush_line(stripped)
+            elif stripped.startswith(ACTIVITIES_HEADER):
+                in_activities = True
+
+        return self
+
+    def parse_lambda_log(self, encoded: str) -> None:
+        try:
+            line = _loads(encoded)
+        except ValueError:
+            self.skipped += 1
+            return
+
+        # Extra prints from the trader end up in the same lambdaLog; Logger.flush
+        # always writes last
+        if line.strip():
+            self.parse_flush_line(line.strip().splitlines()[-1])
+
+    def parse_flush_line(self, line: str) -> None:
+        # A flush line cut off by the exchange's own log limit is not valid JSON,
+        # and other output can be valid JSON of the wrong shape. Everything is
+        # unpacked before any table is touched, so such lines are counted and
+        # skipped without leaving partial rows behind.
+        try:
+            compressed_state, orders, conversions, trader_data, logs = _loads(line)
+            timestamp, _, _, order_depths, own_trades, market_trades, position, _ = compressed_state
+
+            order_rows = [(timestamp, symbol, price, quantity) for symbol, price, quantity in orders]
+            own_trade_rows = self.trade_rows(timestamp, own_trades)
+            market_trade_rows = self.trade_rows(timestamp, market_trades)
+            position_rows = [(timestamp, product, product_position) for product, product_position in position.items()]
+
+            # JSON turns the integer price keys of OrderDepth into strings
+            book_rows = []
+            for symbol, (buy_orders, sell_orders) in order_depths.items():
+                book_rows.extend((timestamp, symbol, "bid", int(price), volume) for price, volume in buy_orders.items())
+                book_rows.extend((timestamp, symbol, "ask", int(price), volume) for price, volume in sell_orders.items())
+
+            truncated = trader_data.endswith(TRUNCATION_MARKER) or logs.endswith(TRUNCATION_MARKER)
+        except (ValueError, TypeError, AttributeError):
+            self.skipped += 1
+            return
+
+        for table, rows in ((self.orders, order_rows), (self.own_trades, own_trade_rows),
+                            (self.market_trades, market_trade_rows), (self.positions, position_rows),
+                            (self.books, book_rows)):
+            for row in rows:
+                table.append(*row)
+        self.logs.append(timestamp, conversions, trader_data, logs, truncated)
+
+    def trade_rows(self, timestamp: int, trades: List[List[Any]]) -> List[tuple]:
+        return [(timestamp, symbol, price, quantity, buyer, seller, trade_timestamp)
+                for symbol, price, quantity, buyer, seller, trade_timestamp in trades]
+
+    def parse_activity_line(self, line: str) -> None:
+        fields = line.split(";")
+        if self.activities is None:
+            self.activities = Table(fields)
+            return
+
+        self.activities.append(*(self.parse_activity_field(field) for field in fields))
+
+    def parse_activity_field(self, field: str) -> Any:
+        if not field:
+            return None
+
+        try:
+            return int(field)
+        except ValueError:
+            pass
+
+        try:
+            return float(field)
+        except ValueError:
+            return field
+
+    def write_csv(self, output_dir: str) -> None:
+        os.makedirs(output_dir, exist_ok=True)
+        for name, table in self.tables().items():
+            table.write_csv(os.path.join(output_dir, name + ".csv"))
+
+
+def parse_log(path: str) -> LogParser:
+    return LogParser().parse_file(path)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python log_parser.py <submission.log> [output_dir]")
+        sys.exit(1)
+
+    log_path = sys.argv[1]
+    output_dir = sys.argv[2] if len(sys.argv) > 2 else os.path.splitext(log_path)[0] + "_tables"
+
+    start = time.perf_counter()
+    parser = parse_log(log_path)
+    parsed = time.perf_counter()
+    parser.write_csv(output_dir)
+
+    for name, table in parser.tables().items():
+        print(f"{name}: {len(table)} rows")
+    print(f"skipped {parser.skipped} lines")
+    print(f"parsed in {parsed - start:.2f}s, wrote {output_dir} in {time.perf_counter() - parsed:.2f}s")
@@ -0,0 +1,12 @@
+# Exchange position limits per product, used by the replay exchange and the
+# synthetic data generator. Trader modules keep their own copy because a
+# submission has to be a single file.
+POSITION_LIMITS = {
+    'CHOCOLATE': 250,
+    'STRAWBERRIES': 350,
+    'ROSES': 60,
+    'GIFT_BASKET': 60,
+    'ORCHIDS': 100,
+    'STARFRUIT': 20,
+    'AMETHYSTS': 20
+}
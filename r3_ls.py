@@ -1,10 +1,6 @@
-from datamodel import OrderDepth, UserId, TradingState, Order
-from typing import List
-import string
-
+from __future__ import annotations
 import json
 from datamodel import Listing, Observation, Order, OrderDepth, ProsperityEncoder, Symbol, Trade, TradingState
-from typing import Any
 
 
 class Logger:
@@ -12,7 +8,7 @@ class Logger:
         self.logs = ""
         self.max_log_length = 3750
 
-    def print(self, *objects: Any, sep: str = " ", end: str = "\n") -> None:
+    def print(self, *objects: object, sep: str = " ", end: str = "\n") -> None:
         self.logs += sep.join(map(str, objects)) + end
 
     def flush(self, state: TradingState, orders: dict[Symbol, list[Order]], conversions: int, trader_data: str) -> None:
@@ -38,7 +34,7 @@ class Logger:
 
         self.logs = ""
 
-    def compress_state(self, state: TradingState, trader_data: str) -> list[Any]:
+    def compress_state(self, state: TradingState, trader_data: str) -> list[object]:
         return [
             state.timestamp,
             trader_data,
@@ -50,7 +46,7 @@ class Logger:
             self.compress_observations(state.observations),
         ]
 
-    def compress_listings(self, listings: dict[Symbol, Listing]) -> list[list[Any]]:
+    def compress_listings(self, listings: dict[Symbol, Listing]) -> list[list[object]]:
         compressed = []
         for listing in listings.values():
             compressed.append(
@@ -58,7 +54,7 @@ class Logger:
 
         return compressed
 
-    def compress_order_depths(self, order_depths: dict[Symbol, OrderDepth]) -> dict[Symbol, list[Any]]:
+    def compress_order_depths(self, order_depths: dict[Symbol, OrderDepth]) -> dict[Symbol, list[object]]:
         compressed = {}
         for symbol, order_depth in order_depths.items():
             compressed[symbol] = [
@@ -66,7 +62,7 @@ class Logger:
 
         return compressed
 
-    def compress_trades(self, trades: dict[Symbol, list[Trade]]) -> list[list[Any]]:
+    def compress_trades(self, trades: dict[Symbol, list[Trade]]) -> list[list[object]]:
         compressed = []
         for arr in trades.values():
             for trade in arr:
@@ -81,7 +77,7 @@ class Logger:
 
         return compressed
 
-    def compress_observations(self, observations: Observation) -> list[Any]:
+    def compress_observations(self, observations: Observation) -> list[object]:
         conversion_observations = {}
         for product, observation in observations.conversionObservations.items():
             conversion_observations[product] = [
@@ -96,7 +92,7 @@ class Logger:
 
         return [observations.plainValueObservations, conversion_observations]
 
-    def compress_orders(self, orders: dict[Symbol, list[Order]]) -> list[list[Any]]:
+    def compress_orders(self, orders: dict[Symbol, list[Order]]) -> list[list[object]]:
         compressed = []
         for arr in orders.values():
             for order in arr:
@@ -104,7 +100,7 @@ class Logger:
 
         return compressed
 
-    def to_json(self, value: Any) -> str:
+    def to_json(self, value: object) -> str:
         return json.dumps(value, cls=ProsperityEncoder, separators=(",", ":"))
 
     def truncate(self, value: str, max_length: int) -> str:
@@ -137,7 +133,7 @@ class Trader:
         for product in state.order_depths:
             position_limit = self.position_limits[product]
             order_depth: OrderDepth = state.order_depths[product]
-            orders: List[Order] = []
+            orders: list[Order] = []
 
             if not order_depth:
                 continue
@@ -1,10 +1,10 @@
-from datamodel import OrderDepth, UserId, TradingState, Order
-from typing import List
-import string
-
+from __future__ import annotations
+import bisect
 import json
-from datamodel import Listing, Observation, Order, OrderDepth, ProsperityEncoder, Symbol, Trade, TradingState
-from typing import Any
+import math
+import sys
+from collections import OrderedDict, deque
+from datamodel import Listing, Observation, Order, OrderDepth, ProsperityEncoder, Symbol, Trade, TradingState, UserId
 
 
 class Logger:
@@ -12,7 +12,7 @@ class Logger:
         self.logs = ""
         self.max_log_length = 3750
 
-    def print(self, *objects: Any, sep: str = " ", end: str = "\n") -> None:
+    def print(self, *objects: object, sep: str = " ", end: str = "\n") -> None:
         self.logs += sep.join(map(str, objects)) + end
 
     def flush(self, state: TradingState, orders: dict[Symbol, list[Order]], conversions: int, trader_data: str) -> None:
@@ -38,7 +38,7 @@ class Logger:
 
         self.logs = ""
 
-    def compress_state(self, state: TradingState, trader_data: str) -> list[Any]:
+    def compress_state(self, state: TradingState, trader_data: str) -> list[object]:
         return [
             state.timestamp,
             trader_data,
@@ -50,7 +50,7 @@ class Logger:
             self.compress_observations(state.observations),
         ]
 
-    def compress_listings(self, listings: dict[Symbol, Listing]) -> list[list[Any]]:
+    def compress_listings(self, listings: dict[Symbol, Listing]) -> list[list[object]]:
         compressed = []
         for listing in listings.values():
             compressed.append(
@@ -58,7 +58,7 @@ class Logger:
 
         return compressed
 
-    def compress_order_depths(self, order_depths: dict[Symbol, OrderDepth]) -> dict[Symbol, list[Any]]:
+    def compress_order_depths(self, order_depths: dict[Symbol, OrderDepth]) -> dict[Symbol, list[object]]:
         compressed = {}
         for symbol, order_depth in order_depths.items():
             compressed[symbol] = [
@@ -66,7 +66,7 @@ class Logger:
 
         return compressed
 
-    def compress_trades(self, trades: dict[Symbol, list[Trade]]) -> list[list[Any]]:
+    def compress_trades(self, trades: dict[Symbol, list[Trade]]) -> list[list[object]]:
         compressed = []
         for arr in trades.values():
             for trade in arr:
@@ -81,7 +81,7 @@ class Logger:
 
         return compressed
 
-    def compress_observations(self, observations: Observation) -> list[Any]:
+    def compress_observations(self, observations: Observation) -> list[object]:
         conversion_observations = {}
         for product, observation in observations.conversionObservations.items():
             conversion_observations[product] = [
@@ -96,7 +96,7 @@ class Logger:
 
         return [observations.plainValueObservations, conversion_observations]
 
-    def compress_orders(self, orders: dict[Symbol, list[Order]]) -> list[list[Any]]:
+    def compress_orders(self, orders: dict[Symbol, list[Order]]) -> list[list[object]]:
         compressed = []
         for arr in orders.values():
             for order in arr:
@@ -104,7 +104,7 @@ class Logger:
 
         return compressed
 
-    def to_json(self, value: Any) -> str:
+    def to_json(self, value: object) -> str:
         return json.dumps(value, cls=ProsperityEncoder, separators=(",", ":"))
 
     def truncate(self, value: str, max_length: int) -> str:
@@ -117,10 +117,437 @@ class Logger:
 logger = Logger()
 
 
+class QuotingEngine:
+    # Inventory-aware market maker in the spirit of Avellaneda-Stoikov: quotes are
+    # centred on a reservation price skewed against inventory (capped at max_skew
+    # so a full position never quotes far through fair value), with a half spread
+    # that widens from min_half_spread with volatility and with how aggressively
+    # our quotes have been filled.
+    # Everything that depends only on (position, volatility bucket, fill bucket)
+    # is precomputed at startup, so a tick costs a couple of bisects and a lookup.
+    def __init__(self, product: Symbol, position_limit: int,
+                 risk_aversion: float = 0.2,
+                 max_skew: float = 2.0,
+                 volatility_buckets: tuple[float, ...] = (0.5, 1.0, 1.5, 2.0, 3.0, 4.0),
+                 fill_rate_buckets: tuple[float, ...] = (0.05, 0.1, 0.2, 0.4),
+                 layer_sizes: tuple[int, ...] = (10, 5, 5),
+                 layer_step: float = 1.0,
+                 min_half_spread: float = 1.0,
+                 volatility_window: int = 50,
+                 fill_rate_decay: float = 0.05) -> None:
+        self.product = product
+        self.position_limit = position_limit
+        self.risk_aversion = risk_aversion
+        self.max_skew = max_skew
+        self.volatility_buckets = volatility_buckets
+        self.fill_rate_buckets = fill_rate_buckets
+        self.layer_sizes = layer_sizes
+        self.layer_step = layer_step
+        self.min_half_spread = min_half_spread
+        self.volatility_window = volatility_window
+        self.fill_rate_decay = fill_rate_decay
+
+        self.last_mid_price = None
+        self.mid_changes = deque()
+        self.change_sum = 0.0
+        self.change_sq_sum = 0.0
+        self.fill_rate = fill_rate_buckets[len(fill_rate_buckets) // 2]
+        self.last_timestamp = -1
+        self.quoted_volume = 0
+
+        self.table = self.build_table()
+
+    def __repr__(self) -> str:
+        return (f'QuotingEngine(product={self.product}, volatility={self.volatility():.3f}, '
+                f'fill_rate={self.fill_rate:.3f}, last_mid_price={self.last_mid_price}, '
+                f'quoted_volume={self.quoted_volume})')
+
+    def build_table(self) -> list[list[list[object]]]:
+        # table[fill bucket][volatility bucket][position + limit] -> (bid layers, ask layers),
+        # each layer an (offset from mid, size) pair
+        table = []
+        for fill_rate in self.fill_rate_buckets:
+            # Fill intensity decays as exp(-k * distance); solve k from the fill
+            # rate observed at the minimum quoting distance
+            k = -math.log(fill_rate) / self.min_half_spread
+            by_volatility = []
+            for volatility in self.volatility_buckets:
+                variance = volatility * volatility
+                half_spread = (self.min_half_spread + self.risk_aversion * variance / 2 +
+                               math.log(1 + self.risk_aversion / k) / self.risk_aversion)
+                by_position = []
+                for position in range(-self.position_limit, self.position_limit + 1):
+                    skew = max(-self.max_skew, min(self.max_skew, -position * self.risk_aversion * variance))
+                    by_position.append((
+                        self.build_layers(skew - half_spread, -self.layer_step,
+                                          self.position_limit - position),
+                        self.build_layers(skew + half_spread, self.layer_step,
+                                          self.position_limit + position),
+                    ))
+                by_volatility.append(by_position)
+            table.append(by_volatility)
+
+        return table
+
+    def build_layers(self, offset: float, step: float, capacity: int) -> list[object]:
+        layers = []
+        for size in self.layer_sizes:
+            size = min(size, capacity)
+            if size <= 0:
+                break
+            layers.append((offset, size))
+            capacity -= size
+            offset += step
+
+        return layers
+
+    def update_volatility(self, mid_price: float) -> None:
+        if self.last_mid_price is not None:
+            change = mid_price - self.last_mid_price
+            self.mid_changes.append(change)
+            self.change_sum += change
+            self.change_sq_sum += change * change
+            if len(self.mid_changes) > self.volatility_window:
+                old = self.mid_changes.popleft()
+                self.change_sum -= old
+                self.change_sq_sum -= old * old
+        self.last_mid_price = mid_price
+
+    def volatility(self) -> float:
+        n = len(self.mid_changes)
+        if n < 2:
+            return self.volatility_buckets[(len(self.volatility_buckets) - 1) // 2]
+        mean = self.change_sum / n
+        return math.sqrt(max(0.0, self.change_sq_sum / n - mean * mean))
+
+    def update_fill_rate(self, state: TradingState) -> None:
+        if self.quoted_volume <= 0:
+            return
+        filled = 0
+        for trade in state.own_trades.get(self.product, []):
+            if trade.timestamp >= self.last_timestamp:
+                filled += abs(trade.quantity)
+        observed = min(1.0, filled / self.quoted_volume)
+        self.fill_rate += self.fill_rate_decay * (observed - self.fill_rate)
+
+    def bucket(self, buckets: tuple[float, ...], value: float) -> int:
+        return min(bisect.bisect_left(buckets, value), len(buckets) - 1)
+
+    def quote(self, state: TradingState, order_depth: OrderDepth) -> list[Order]:
+        if not order_depth.buy_orders or not order_depth.sell_orders:
+            # Nothing is quoted this tick, so no later fills can be attributed to it
+            self.last_timestamp = state.timestamp
+            self.quoted_volume = 0
+            return []
+
+        best_ask = min(order_depth.sell_orders)
+        best_bid = max(order_depth.buy_orders)
+        mid_price = (best_ask + best_bid) / 2
+        self.update_volatility(mid_price)
+        self.update_fill_rate(state)
+
+        position = max(-self.position_limit,
+                       min(self.position_limit, state.position.get(self.product, 0)))
+        fill_bucket = self.bucket(self.fill_rate_buckets, self.fill_rate)
+        volatility_bucket = self.bucket(self.volatility_buckets, self.volatility())
+        bid_layers, ask_layers = self.table[fill_bucket][volatility_bucket][position + self.position_limit]
+
+        # Stay passive: layers pushed onto the same price by the clamp are merged
+        bids: dict[int, int] = {}
+        for offset, size in bid_layers:
+            price = min(math.floor(mid_price + offset), best_ask - 1)
+            bids[price] = bids.get(price, 0) + size
+        asks: dict[int, int] = {}
+        for offset, size in ask_layers:
+            price = max(math.ceil(mid_price + offset), best_bid + 1)
+            asks[price] = asks.get(price, 0) + size
+
+        orders = [Order(self.product, price, size) for price, size in bids.items()]
+        orders.extend(Order(self.product, price, -size) for price, size in asks.items())
+
+        self.last_timestamp = state.timestamp
+        self.quoted_volume = sum(abs(order.quantity) for order in orders)
+        return orders
+
+
+class CounterpartyStats:
+    __slots__ = ('net_flow', 'flow_timestamp', 'average_size', 'drift', 'trades', 'drifts')
+
+    def __init__(self) -> None:
+        self.net_flow = 0.0
+        self.flow_timestamp = 0
+        self.average_size = 0.0
+        self.drift = 0.0
+        self.trades = 0
+        self.drifts = 0
+
+
+class CounterpartyFlow:
+    # Incremental per-(product, counterparty) index of market and own trades.
+    # Every statistic is an exponential average updated as trades arrive, so
+    # memory is bounded by the number of counterparties (capped, least recently
+    # seen evicted first) plus the trades still waiting for their drift horizon.
+    def __init__(self, flow_half_life: int = 2000, size_decay: float = 0.1,
+                 drift_decay: float = 0.1, drift_horizon: int = 500,
+                 max_counterparties: int = 256, max_pending: int = 10000) -> None:
+        # Half life and horizon are in timestamp units (100 per tick)
+        self.flow_decay = 0.5 ** (1 / flow_half_life)
+        self.size_decay = size_decay
+        self.drift_decay = drift_decay
+        self.drift_horizon = drift_horizon
+        self.max_counterparties = max_counterparties
+        self.stats: OrderedDict = OrderedDict()
+        self.pending = deque(maxlen=max_pending)
+        self.last_trade_timestamp = -1
+
+    def __repr__(self) -> str:
+        return (f'CounterpartyFlow(counterparties={len(self.stats)}, pending={len(self.pending)}, '
+                f'last_trade_timestamp={self.last_trade_timestamp})')
+
+    def get(self, product: Symbol, counterparty: UserId) -> CounterpartyStats:
+        key = (product, counterparty)
+        stats = self.stats.get(key)
+        if stats is None:
+            stats = self.stats[key] = CounterpartyStats()
+            if len(self.stats) > self.max_counterparties:
+                self.stats.popitem(last=False)
+        else:
+            self.stats.move_to_end(key)
+
+        return stats
+
+    def decayed_flow(self, stats: CounterpartyStats, timestamp: int) -> float:
+        return stats.net_flow * self.flow_decay ** (timestamp - stats.flow_timestamp)
+
+    def record(self, product: Symbol, counterparty: UserId, signed_quantity: int, timestamp: int) -> None:
+        stats = self.get(product, counterparty)
+        stats.net_flow = self.decayed_flow(stats, timestamp) + signed_quantity
+        stats.flow_timestamp = timestamp
+        # The averages start from their first observation rather than from zero
+        if stats.trades == 0:
+            stats.average_size = abs(signed_quantity)
+        else:
+            stats.average_size += self.size_decay * (abs(signed_quantity) - stats.average_size)
+        stats.trades += 1
+
+    def update(self, state: TradingState, mid_prices: dict[Symbol, float]) -> None:
+        latest = self.last_trade_timestamp
+        for trades in (state.market_trades, state.own_trades):
+            for product, product_trades in trades.items():
+                for trade in product_trades:
+                    if trade.timestamp <= self.last_trade_timestamp:
+                        continue
+                    latest = max(latest, trade.timestamp)
+                    for counterparty, sign in ((trade.buyer, 1), (trade.seller, -1)):
+                        if counterparty and counterparty != 'SUBMISSION':
+                            self.record(product, counterparty, sign * trade.quantity, trade.timestamp)
+                    self.pending.append((trade.timestamp + self.drift_horizon, product,
+                                         trade.price, trade.buyer, trade.seller))
+        self.last_trade_timestamp = latest
+
+        # Trades come in timestamp order, so the ones due for drift are at the front
+        while self.pending and self.pending[0][0] <= state.timestamp:
+            _, product, price, buyer, seller = self.pending.popleft()
+            mid_price = mid_prices.get(product)
+            if mid_price is None:
+                continue
+            for counterparty, sign in ((buyer, 1), (seller, -1)):
+                if counterparty and counterparty != 'SUBMISSION':
+                    stats = self.get(product, counterparty)
+                    move = sign * (mid_price - price)
+                    if stats.drifts == 0:
+                        stats.drift = move
+                    else:
+                        stats.drift += self.drift_decay * (move - stats.drift)
+                    stats.drifts += 1
+
+    def net_flow(self, product: Symbol, counterparty: UserId, timestamp: int) -> float:
+        stats = self.stats.get((product, counterparty))
+        return self.decayed_flow(stats, timestamp) if stats else 0.0
+
+    def average_size(self, product: Symbol, counterparty: UserId) -> float:
+        stats = self.stats.get((product, counterparty))
+        return stats.average_size if stats else 0.0
+
+    def drift(self, product: Symbol, counterparty: UserId) -> float:
+        # Average mid move in the counterparty's favour drift_horizon after their trades;
+        # persistently positive values point at an informed trader
+        stats = self.stats.get((product, counterparty))
+        return stats.drift if stats else 0.0
+
+
+class BasketHedger:
+    # Offsets the component exposure that basket positions add to each leg.
+    # Standalone leg inventory is left to that leg's own market making: a leg
+    # is only traded while its net delta (leg position plus basket weight times
+    # basket position) has the same sign as the basket exposure, and never by
+    # more than that exposure. The basket weights are laid out per leg once at
+    # startup, so each tick is a single pass over the legs.
+    def __init__(self, baskets: dict[Symbol, dict[Symbol, int]], position_limits: dict[Symbol, int],
+                 min_hedge: int = 1) -> None:
+        self.position_limits = position_limits
+        self.min_hedge = min_hedge
+        self.legs: list[Symbol] = sorted({leg for weights in baskets.values() for leg in weights})
+        self.exposures: list[list[tuple[Symbol, int]]] = [
+            [(basket, weights[leg]) for basket, weights in baskets.items() if leg in weights]
+            for leg in self.legs
+        ]
+
+    def __repr__(self) -> str:
+        return f'BasketHedger(legs={self.legs}, min_hedge={self.min_hedge})'
+
+    def basket_exposures(self, position: dict[Symbol, int]) -> list[int]:
+        return [sum(weight * position.get(basket, 0) for basket, weight in exposure)
+                for exposure in self.exposures]
+
+    def walk_book(self, leg: Symbol, levels: list[tuple[int, int]], quantity: int, sign: int) -> list[Order]:
+        orders = []
+        for price, volume in levels:
+            if quantity <= 0:
+                break
+            size = min(quantity, abs(volume))
+            orders.append(Order(leg, price, sign * size))
+            quantity -= size
+
+        return orders
+
+    def hedge(self, state: TradingState, placed: dict[Symbol, list[Order]]) -> dict[Symbol, list[Order]]:
+        # Returns the complete order list for every leg that needs hedging. Orders
+        # on the opposite side are dropped so a leg never buys and sells in one
+        # tick. Orders already placed on the hedge side are kept and use up limit
+        # room, but only those that cross the book count towards the hedge, since
+        # a passive quote may never fill.
+        hedged = {}
+        for leg, exposure in zip(self.legs, self.basket_exposures(state.position)):
+            order_depth = state.order_depths.get(leg)
+            position = state.position.get(leg, 0)
+            delta = position + exposure
+            if order_depth is None or delta * exposure <= 0:
+                continue
+
+            needed = min(abs(delta), abs(exposure))
+            if needed < self.min_hedge:
+                continue
+
+            sign = -1 if delta > 0 else 1
+            kept = [order for order in placed.get(leg, []) if order.quantity * sign > 0]
+            if sign > 0:
+                levels = sorted(order_depth.sell_orders.items())
+            else:
+                levels = sorted(order_depth.buy_orders.items(), reverse=True)
+            marketable = sum(abs(order.quantity) for order in kept
+                             if levels and sign * (order.price - levels[0][0]) >= 0)
+            room = self.position_limits[leg] - sign * position - sum(abs(order.quantity) for order in kept)
+            quantity = min(needed - marketable, room)
+
+            hedged[leg] = kept + self.walk_book(leg, levels, quantity, sign)
+
+        return hedged
+
+
+class BoundedHistory:
+    # Append-only history that keeps the last `retention` values verbatim. Older
+    # values are folded into running summary statistics and into a bounded
+    # series of bucket means, so memory stays flat however long the session runs.
+    def __init__(self, retention: int, bucket_size: int = 100, max_buckets: int = 100) -> None:
+        self.retention = retention
+        self.bucket_size = bucket_size
+        self.recent = deque()
+        self.downsampled = deque(maxlen=max_buckets)
+        self.bucket_sum = 0.0
+        self.bucket_count = 0
+        self.count = 0
+        self.evicted = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.minimum = None
+        self.maximum = None
+
+    def __len__(self) -> int:
+        return len(self.recent)
+
+    def __getitem__(self, index: int) -> object:
+        return self.recent[index]
+
+    def __repr__(self) -> str:
+        tail = list(self.recent)[-5:]
+        return f'BoundedHistory(recent[-{len(tail)}:]={tail}, retained={len(self.recent)}, summary={self.summary()})'
+
+    def append(self, value: float) -> None:
+        self.recent.append(value)
+        self.count += 1
+        if len(self.recent) > self.retention:
+            self.summarise(self.recent.popleft())
+
+    def summarise(self, value: float) -> None:
+        self.evicted += 1
+        delta = value - self.mean
+        self.mean += delta / self.evicted
+        self.m2 += delta * (value - self.mean)
+        self.minimum = value if self.minimum is None else min(self.minimum, value)
+        self.maximum = value if self.maximum is None else max(self.maximum, value)
+
+        self.bucket_sum += value
+        self.bucket_count += 1
+        if self.bucket_count == self.bucket_size:
+            self.downsampled.append(self.bucket_sum / self.bucket_count)
+            self.bucket_sum = 0.0
+            self.bucket_count = 0
+
+    def summary(self) -> dict[str, object]:
+        return {
+            'count': self.count,
+            'evicted': self.evicted,
+            'mean': self.mean if self.evicted else None,
+            'std': math.sqrt(self.m2 / self.evicted) if self.evicted else None,
+            'min': self.minimum,
+            'max': self.maximum,
+        }
+
+
+class SessionMemory:
+    # Hands out BoundedHistory fields with per-field retention and reports how
+    # much memory each attribute of the owning Trader holds.
+    def __init__(self, default_retention: int = 1000, retention: dict[str, int] | None = None,
+                 bucket_size: int = 100, max_buckets: int = 100) -> None:
+        self.default_retention = default_retention
+        self.retention = retention or {}
+        self.bucket_size = bucket_size
+        self.max_buckets = max_buckets
+
+    def history(self, name: str) -> BoundedHistory:
+        return BoundedHistory(self.retention.get(name, self.default_retention),
+                              self.bucket_size, self.max_buckets)
+
+    def deep_size(self, value: object, seen: set) -> int:
+        if id(value) in seen:
+            return 0
+        seen.add(id(value))
+
+        size = sys.getsizeof(value)
+        if isinstance(value, dict):
+            size += sum(self.deep_size(k, seen) + self.deep_size(v, seen) for k, v in value.items())
+        elif isinstance(value, (list, tuple, set, frozenset, deque)):
+            size += sum(self.deep_size(item, seen) for item in value)
+        elif hasattr(value, '__dict__'):
+            size += self.deep_size(vars(value), seen)
+        elif hasattr(value, '__slots__'):
+            size += sum(self.deep_size(getattr(value, slot), seen)
+                        for slot in value.__slots__ if hasattr(value, slot))
+
+        return size
+
+    def report(self, owner: object) -> dict[str, int]:
+        # Approximate bytes per attribute; objects shared between fields count once
+        seen = set()
+        return {name: self.deep_size(value, seen) for name, value in vars(owner).items()}
+
+
 class Trader:
     def __init__(self):
-        self.humidity_history = []
-        self.sunlight_history = []
+        self.session_memory = SessionMemory(default_retention=1000)
+        self.humidity_history = self.session_memory.history('humidity_history')
+        self.sunlight_history = self.session_memory.history('sunlight_history')
         self.position_limits = {
             'CHOCOLATE': 250,
             'STRAWBERRIES': 350,
@@ -130,6 +557,11 @@ class Trader:
             'STARFRUIT': 20,
             'AMETHYSTS': 20
         }
+        self.amethysts_quoter = QuotingEngine(
+            'AMETHYSTS', self.position_limits['AMETHYSTS'])
+        self.counterparty_flow = CounterpartyFlow()
+        self.basket_hedger = BasketHedger(
+            {'GIFT_BASKET': {'CHOCOLATE': 4, 'STRAWBERRIES': 6, 'ROSES': 1}}, self.position_limits)
 
     def compute_mid_price(self, sell_orders, buy_orders):
         if sell_orders and buy_orders:
@@ -172,6 +604,10 @@ class Trader:
         result = {}
         product_prices = {}
 
+        self.counterparty_flow.update(state, {
+            product: self.compute_mid_price(order_depth.sell_orders, order_depth.buy_orders)
+            for product, order_depth in state.order_depths.items()})
+
         target_symbols = ['CHOCOLATE', 'STRAWBERRIES', 'ROSES']
 
         for product in target_symbols:
@@ -197,7 +633,7 @@ class Trader:
         for product in state.order_depths:
             position_limit = self.position_limits[product]
             order_depth: OrderDepth = state.order_depths[product]
-            orders: List[Order] = []
+            orders: list[Order] = []
 
             if not order_depth:
                 continue
@@ -205,29 +641,7 @@ class Trader:
             current_inventory = state.position.get(product, 0)
 
             if product == 'AMETHYSTS':
-                best_ask = min(order_depth.sell_orders.keys())
-                best_bid = max(order_depth.buy_orders.keys())
-                mid_price = (best_ask + best_bid) / 2
-
-                position = state.position.get(product, 0)
-                position_limit = self.position_limits[product]
-
-                if position > 0.5 * position_limit:
-                    ask_price = int(mid_price + 1)
-                    ask_size = int(min(10, position_limit - position))
-                    if ask_size > 0:
-                        orders.append(Order(product, ask_price, -ask_size))
-                elif position < -0.5 * position_limit:
-                    bid_price = int(mid_price - 1)
-                    bid_size = int(min(10, position_limit + position))
-                    if bid_size > 0:
-                        orders.append(Order(product, bid_price, bid_size))
-                else:
-                    ask_price = int(mid_price + 2)
-                    bid_price = int(mid_price - 2)
-                    ask_size = bid_size = 10
-                    orders.append(Order(product, ask_price, -ask_size))
-                    orders.append(Order(product, bid_price, bid_size))
+                orders.extend(self.amethysts_quoter.quote(state, order_depth))
 
             elif product == 'ORCHIDS':
                 current_sunlight = state.observations.conversionObservations["ORCHIDS"].sunlight
@@ -334,22 +748,6 @@ class Trader:
                 gift_mid_price = (best_ask + best_bid) / 2
 
                 mid_prices['GIFT_BASKET'] = gift_mid_price
-               # if net_position > 0:
-
-               #     hedge_size = min(
-               #         net_position, position_limit - current_inventory)
-               #     if hedge_size > 0:
-
-               #         orders.append(
-               #             Order(product, best_ask, -hedge_size))
-               # elif net_position < 0:
-               #     # If net position is negative, we want to buy the GIFT_BASKET
-               #     hedge_size = min(-net_position,
-               #                      position_limit + current_inventory)
-               #     if hedge_size > 0:
-
-               #         orders.append(
-               #             Order(product, best_bid, hedge_size))
                 # if mid_prices['GIFT_BASKET'] > fair_value:
                 #     # The GIFT_BASKET is overvalued, so we should consider selling
                 #     size_to_sell = min(
@@ -391,6 +789,10 @@ class Trader:
 
             result[product] = orders
 
+        for leg, leg_orders in self.basket_hedger.hedge(state, result).items():
+            logger.print("Hedge " + leg + ": " + str(leg_orders))
+            result[leg] = leg_orders
+
         traderData = ""
         conversions = 1
         logger.flush(state, result, conversions, traderData)
@@ -0,0 +1,221 @@
+import base64
+import io
+import json
+import pickle
+import sys
+from contextlib import redirect_stdout
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from datamodel import ConversionObservation, Observation, Order, OrderDepth, Trade, TradingState
+from replay import load_day, replay_day
+
+
+STATE_TAG = b'S'
+CHECKPOINT_TAG = b'C'
+
+
+def encode_trades(trades: Dict[str, List[Trade]]) -> List[List[Any]]:
+    return [[trade.symbol, trade.price, trade.quantity, trade.buyer, trade.seller, trade.timestamp]
+            for symbol_trades in trades.values() for trade in symbol_trades]
+
+
+def decode_trades(encoded: List[List[Any]]) -> Dict[str, List[Trade]]:
+    trades: Dict[str, List[Trade]] = {}
+    for symbol, price, quantity, buyer, seller, timestamp in encoded:
+        trades.setdefault(symbol, []).append(Trade(symbol, price, quantity, buyer, seller, timestamp))
+
+    return trades
+
+
+def encode_state(state: TradingState) -> List[Any]:
+    # Same layout as Logger.compress_state, so recordings and submission logs
+    # can be read with the same code
+    return [
+        state.timestamp,
+        state.traderData,
+        [[listing["symbol"], listing["product"], listing["denomination"]] for listing in state.listings.values()],
+        {symbol: [order_depth.buy_orders, order_depth.sell_orders]
+         for symbol, order_depth in state.order_depths.items()},
+        encode_trades(state.own_trades),
+        encode_trades(state.market_trades),
+        state.position,
+        [state.observations.plainValueObservations,
+         {product: [observation.bidPrice, observation.askPrice, observation.transportFees,
+                    observation.exportTariff, observation.importTariff, observation.sunlight,
+                    observation.humidity]
+          for product, observation in state.observations.conversionObservations.items()}],
+    ]
+
+
+def decode_state(encoded: List[Any]) -> TradingState:
+    timestamp, trader_data, listings, order_depths, own_trades, market_trades, position, observations = encoded
+
+    depths = {}
+    for symbol, (buy_orders, sell_orders) in order_depths.items():
+        # JSON turns the integer price keys into strings
+        order_depth = OrderDepth()
+        order_depth.buy_orders = {int(price): volume for price, volume in buy_orders.items()}
+        order_depth.sell_orders = {int(price): volume for price, volume in sell_orders.items()}
+        depths[symbol] = order_depth
+
+    plain_observations, conversion_observations = observations
+    return TradingState(
+        trader_data,
+        timestamp,
+        {symbol: {"symbol": symbol, "product": product, "denomination": denomination}
+         for symbol, product, denomination in listings},
+        depths,
+        decode_trades(own_trades),
+        decode_trades(market_trades),
+        position,
+        Observation(plain_observations, {product: ConversionObservation(*values)
+                                         for product, values in conversion_observations.items()}),
+    )
+
+
+def encode_outputs(orders: Dict[str, List[Order]], conversions: int, trader_data: str) -> List[Any]:
+    return [{symbol: [[order.price, order.quantity] for order in symbol_orders]
+             for symbol, symbol_orders in orders.items()}, conversions, trader_data]
+
+
+class Recorder:
+    # Writes one line per tick to the recording: "S" lines hold the encoded
+    # TradingState input and the trader's outputs, and every checkpoint_every
+    # ticks a "C" line holds the pickled Trader as it was before that tick ran.
+    # A recording holds a single session, so an existing file is overwritten.
+    def __init__(self, path: str, checkpoint_every: int = 1000) -> None:
+        self.file = open(path, 'wb')
+        self.checkpoint_every = checkpoint_every
+        self.ticks = 0
+        self.encoded_state: Optional[List[Any]] = None
+
+    def before_run(self, state: TradingState, trader: Any) -> None:
+        # Encode the input before run() gets a chance to mutate it
+        self.encoded_state = encode_state(state)
+        if self.ticks % self.checkpoint_every == 0:
+            payload = base64.b64encode(pickle.dumps(trader, protocol=pickle.HIGHEST_PROTOCOL))
+            self.file.write(CHECKPOINT_TAG + b'\t' + str(state.timestamp).encode() + b'\t' + payload + b'\n')
+
+    def after_run(self, orders: Dict[str, List[Order]], conversions: int, trader_data: str) -> None:
+        line = json.dumps([self.encoded_state, encode_outputs(orders, conversions, trader_data)],
+                          separators=(',', ':'))
+        self.file.write(STATE_TAG + b'\t' + line.encode() + b'\n')
+        self.ticks += 1
+
+    def close(self) -> None:
+        self.file.close()
+
+
+class Recording:
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.checkpoints: List[Tuple[int, int]] = []
+
+        # Only the tag and timestamp of checkpoint lines are read when indexing
+        offset = 0
+        with open(path, 'rb') as f:
+            for line in f:
+                if line.startswith(CHECKPOINT_TAG):
+                    self.checkpoints.append((int(line.split(b'\t', 2)[1]), offset))
+                offset += len(line)
+
+    def nearest_checkpoint(self, timestamp: int) -> Tuple[int, int]:
+        best = None
+        for checkpoint in self.checkpoints:
+            if checkpoint[0] > timestamp:
+                break
+            best = checkpoint
+        if best is None:
+            raise ValueError(f'no checkpoint at or before timestamp {timestamp}')
+
+        return best
+
+    def ticks(self, start_timestamp: int = 0) -> Iterator[Tuple[Optional[Any], TradingState, List[Any]]]:
+        # Yields (trader restored from a checkpoint line or None, state, recorded outputs)
+        # from the nearest checkpoint at or before start_timestamp onwards
+        _, offset = self.nearest_checkpoint(start_timestamp)
+        with open(self.path, 'rb') as f:
+            f.seek(offset)
+            trader = None
+            for line in f:
+                tag, payload = line.rstrip(b'\n').split(b'\t', 1)
+                if tag == CHECKPOINT_TAG:
+                    trader = pickle.loads(base64.b64decode(payload.split(b'\t', 1)[1]))
+                    continue
+                encoded_state, outputs = json.loads(payload)
+                yield trader, decode_state(encoded_state), outputs
+                trader = None
+
+    def restore(self, timestamp: int) -> Tuple[Any, Optional[TradingState]]:
+        # Returns the Trader as it was just before the tick at `timestamp` ran, and
+        # that tick's input, by replaying forward from the nearest checkpoint
+        trader = None
+        with redirect_stdout(io.StringIO()):
+            for checkpoint_trader, state, _ in self.ticks(timestamp):
+                if checkpoint_trader is not None:
+                    trader = checkpoint_trader
+                if state.timestamp >= timestamp:
+                    return trader, state
+                trader.run(state)
+
+        return trader, None
+
+    def first_divergence(self, start_timestamp: int = 0, end_timestamp: Optional[int] = None) -> Optional[int]:
+        # Re-runs the current code from the checkpoint before start_timestamp and
+        # returns the first timestamp whose outputs differ from the recording
+        trader = None
+        with redirect_stdout(io.StringIO()):
+            for checkpoint_trader, state, recorded in self.ticks(start_timestamp):
+                if end_timestamp is not None and state.timestamp > end_timestamp:
+                    break
+                if trader is None:
+                    trader = checkpoint_trader
+                outputs = json.loads(json.dumps(encode_outputs(*trader.run(state)), separators=(',', ':')))
+                if state.timestamp >= start_timestamp and outputs != recorded:
+                    return state.timestamp
+
+        return None
+
+
+def record_day(module_name: str, prices_path: str, path: str, checkpoint_every: int = 1000) -> Dict[str, Any]:
+    day = load_day(prices_path)
+    recorder = Recorder(path, checkpoint_every)
+    try:
+        return replay_day(module_name, day, recorder)
+    finally:
+        recorder.close()
+        day.close(unlink=True)
+
+
+if __name__ == "__main__":
+    usage = ("Usage: python recorder.py record <module> <prices_round_X_day_Y.csv> <recording> [checkpoint_every]\n"
+             "       python recorder.py restore <recording> <timestamp>\n"
+             "       python recorder.py check <recording> [start_timestamp] [end_timestamp]")
+    # Required arguments per command, after the command name itself
+    required = {'record': 3, 'restore': 2, 'check': 1}
+    if len(sys.argv) < 2 or sys.argv[1] not in required or len(sys.argv) < 2 + required[sys.argv[1]]:
+        print(usage)
+        sys.exit(1)
+
+    command = sys.argv[1]
+    if command == 'record':
+        result = record_day(sys.argv[2], sys.argv[3], sys.argv[4], int(sys.argv[5]) if len(sys.argv) > 5 else 1000)
+        print(f"recorded {result['ticks']} ticks, pnl {result['total']:.1f}")
+    elif command == 'restore':
+        trader, state = Recording(sys.argv[2]).restore(int(sys.argv[3]))
+        if state is None:
+            print("timestamp is past the end of the recording")
+            sys.exit(1)
+        print(f"Trader state before timestamp {state.timestamp}:")
+        for name, value in vars(trader).items():
+            # Objects without a repr of their own would only show their address
+            if type(value).__repr__ is object.__repr__ and hasattr(value, '__dict__'):
+                value = vars(value)
+            print(f"  {name}: {value!r}"[:400])
+        print(json.dumps(encode_state(state)))
+    elif command == 'check':
+        recording = Recording(sys.argv[2])
+        start = int(sys.argv[3]) if len(sys.argv) > 3 else 0
+        end = int(sys.argv[4]) if len(sys.argv) > 4 else None
+        divergence = recording.first_divergence(start, end)
+        print("outputs match the recording" if divergence is None else f"first divergence at timestamp {divergence}")
@@ -0,0 +1,182 @@
+import io
+import json
+import sys
+import time
+from contextlib import redirect_stdout
+from multiprocessing import Pool
+from typing import Any, Dict, List, Optional, Tuple
+
+from recorder import Recording, decode_state, encode_outputs, encode_state
+from synthetic_states import StateGenerator
+
+
+TRADER_MODULES = ['sample_trader', 'r3_ls', 'r3_mm_etf_hedging']
+
+
+def write_corpus(path: str, sequences: Dict[str, List[List[Any]]]) -> None:
+    # One line per tick: [sequence id, encoded TradingState]. Traders keep state
+    # between ticks, so each sequence is always replayed from its start.
+    with open(path, 'w') as f:
+        for sequence_id, states in sequences.items():
+            for encoded_state in states:
+                f.write(json.dumps([sequence_id, encoded_state], separators=(',', ':')) + '\n')
+
+
+def synthetic_corpus(path: str, sequences: int = 8, ticks: int = 1000) -> None:
+    corpus = {}
+    for seed in range(sequences):
+        generator = StateGenerator(seed)
+        corpus[f'synthetic-{seed}'] = [encode_state(generator.next_state()) for _ in range(ticks)]
+    write_corpus(path, corpus)
+
+
+def recording_corpus(path: str, recording_paths: List[str]) -> None:
+    corpus = {}
+    for recording_path in recording_paths:
+        recording = Recording(recording_path)
+        corpus[recording_path] = [encode_state(state)
+                                  for _, state, _ in recording.ticks(recording.checkpoints[0][0])]
+    write_corpus(path, corpus)
+
+
+def load_corpus(path: str) -> Dict[str, List[List[Any]]]:
+    corpus: Dict[str, List[List[Any]]] = {}
+    with open(path) as f:
+        for line in f:
+            sequence_id, encoded_state = json.loads(line)
+            corpus.setdefault(sequence_id, []).append(encoded_state)
+
+    return corpus
+
+
+def run_sequence(module_name: str, sequence_id: str, states: List[List[Any]]) -> Tuple[str, str, Any]:
+    # Outputs go through a JSON round trip so they compare equal to the golden file.
+    # As on the exchange, each tick gets the traderData returned by the one before;
+    # only the first tick uses the corpus's own.
+    try:
+        trader = __import__(module_name).Trader()
+        outputs = []
+        trader_data = None
+        with redirect_stdout(io.StringIO()) as sink:
+            for encoded_state in states:
+                state = decode_state(encoded_state)
+                if trader_data is not None:
+                    state.traderData = trader_data
+                orders, conversions, trader_data = trader.run(state)
+                outputs.append(encode_outputs(orders, conversions, trader_data))
+                sink.seek(0)
+                sink.truncate()
+        return module_name, sequence_id, json.loads(json.dumps(outputs))
+    except Exception as e:
+        return module_name, sequence_id, {'error': f'{type(e).__name__}: {e}'}
+
+
+def run_corpus(corpus: Dict[str, List[List[Any]]], modules: List[str],
+               processes: Optional[int] = None) -> Dict[str, Dict[str, Any]]:
+    jobs = [(module, sequence_id, states) for module in modules for sequence_id, states in corpus.items()]
+    with Pool(processes) as pool:
+        results = pool.starmap(run_sequence, jobs, chunksize=1)
+
+    outputs: Dict[str, Dict[str, Any]] = {}
+    for module, sequence_id, sequence_outputs in results:
+        outputs.setdefault(module, {})[sequence_id] = sequence_outputs
+
+    return outputs
+
+
+def self_crossed_orders(current: Dict[str, Dict[str, Any]], corpus: Dict[str, List[List[Any]]]) -> List[str]:
+    # A buy and a sell at the same price for one symbol in one tick only trade
+    # with ourselves; report them whatever the golden file says
+    crossed = []
+    for module, sequences in current.items():
+        for sequence_id, outputs in sequences.items():
+            if isinstance(outputs, dict):
+                continue
+            for tick, (orders, _, _) in enumerate(outputs):
+                for symbol, symbol_orders in orders.items():
+                    buys = {price for price, quantity in symbol_orders if quantity > 0}
+                    sells = {price for price, quantity in symbol_orders if quantity < 0}
+                    if buys & sells:
+                        timestamp = corpus[sequence_id][tick][0]
+                        crossed.append(f'{module} {sequence_id} timestamp {timestamp}: {symbol} buys and sells at '
+                                       f'{sorted(buys & sells)}')
+
+    return crossed
+
+
+def diff_outputs(golden: Dict[str, Dict[str, Any]], current: Dict[str, Dict[str, Any]],
+                 corpus: Dict[str, List[List[Any]]]) -> List[str]:
+    differences = []
+    for module, sequences in golden.items():
+        for sequence_id, expected in sequences.items():
+            actual = current.get(module, {}).get(sequence_id)
+            # An error result is a failure even when the golden file recorded the same error
+            if isinstance(actual, dict) and 'error' in actual:
+                differences.append(f'{module} {sequence_id}: {actual["error"]}')
+                continue
+            if actual == expected:
+                continue
+            if isinstance(actual, dict) or isinstance(expected, dict):
+                differences.append(f'{module} {sequence_id}: expected {str(expected)[:200]}, got {str(actual)[:200]}')
+                continue
+            for tick, (expected_tick, actual_tick) in enumerate(zip(expected, actual)):
+                if expected_tick != actual_tick:
+                    timestamp = corpus[sequence_id][tick][0]
+                    differences.append(f'{module} {sequence_id} timestamp {timestamp}:\n'
+                                       f'  expected {json.dumps(expected_tick)}\n'
+                                       f'  got      {json.dumps(actual_tick)}')
+                    break
+            else:
+                differences.append(f'{module} {sequence_id}: expected {len(expected)} ticks, got {len(actual)}')
+
+    return differences
+
+
+if __name__ == "__main__":
+    usage = ("Usage: python regression.py corpus <corpus.jsonl> [sequences] [ticks]\n"
+             "       python regression.py import <corpus.jsonl> <recording>...\n"
+             "       python regression.py record <corpus.jsonl> <golden.json> [module...]\n"
+             "       python regression.py check <corpus.jsonl> <golden.json> [-j processes]")
+    if len(sys.argv) < 3:
+        print(usage)
+        sys.exit(1)
+
+    command, corpus_path, args = sys.argv[1], sys.argv[2], sys.argv[3:]
+    processes = None
+    if '-j' in args:
+        index = args.index('-j')
+        processes = int(args[index + 1])
+        del args[index:index + 2]
+
+    start = time.perf_counter()
+    if command == 'corpus':
+        synthetic_corpus(corpus_path, *(int(arg) for arg in args))
+        print(f"wrote {corpus_path}")
+    elif command == 'import':
+        recording_corpus(corpus_path, args)
+        print(f"wrote {corpus_path}")
+    elif command == 'record':
+        golden = run_corpus(load_corpus(corpus_path), args[1:] or TRADER_MODULES, processes)
+        errors = [f'{module} {sequence_id}: {outputs["error"]}'
+                  for module, sequences in golden.items()
+                  for sequence_id, outputs in sequences.items() if isinstance(outputs, dict)]
+        if errors:
+            print("not writing a golden file, some sequences failed:\n" + '\n'.join(errors))
+            sys.exit(1)
+        with open(args[0], 'w') as f:
+            json.dump(golden, f, separators=(',', ':'))
+        print(f"recorded {sum(len(sequences) for sequences in golden.values())} sequences to {args[0]}")
+    elif command == 'check':
+        with open(args[0]) as f:
+            golden = json.load(f)
+        corpus = load_corpus(corpus_path)
+        current = run_corpus(corpus, list(golden), processes)
+        differences = diff_outputs(golden, current, corpus) + self_crossed_orders(current, corpus)
+        print(f"checked in {time.perf_counter() - start:.2f}s")
+        if differences:
+            print('\n'.join(differences))
+            sys.exit(1)
+        print("outputs match the golden file")
+    else:
+        print(usage)
+        sys.exit(1)
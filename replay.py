@@ -0,0 +1,372 @@
+import csv
+import glob
+import importlib
+import io
+import os
+import sys
+import time
+from array import array
+from contextlib import redirect_stdout
+from multiprocessing import Pool
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Dict, List, Optional, Tuple
+
+from datamodel import ConversionObservation, Observation, Order, OrderDepth, Trade, TradingState
+from position_limits import POSITION_LIMITS
+
+
+BOOK_LEVELS = 3
+BOOK_COLUMNS = ['timestamp', 'product'] + [
+    f'{side}_{field}_{level}'
+    for side in ('bid', 'ask')
+    for level in range(1, BOOK_LEVELS + 1)
+    for field in ('price', 'volume')
+]
+TRADE_COLUMNS = ['timestamp', 'symbol', 'price', 'quantity', 'buyer', 'seller']
+OBSERVATION_COLUMNS = ['timestamp', 'bidPrice', 'askPrice', 'transportFees', 'exportTariff',
+                       'importTariff', 'sunlight', 'humidity']
+
+
+class SharedTable:
+    # Columns of one typecode laid out back to back in a single shared memory
+    # segment. Workers attach by name; column() hands out memoryview slices of
+    # the segment, so readers never copy the data.
+    def __init__(self, name: str, columns: List[str], rows: int, typecode: str) -> None:
+        self.name = name
+        self.columns = columns
+        self.rows = rows
+        self.typecode = typecode
+        self.shm: Optional[SharedMemory] = None
+        self.view: Optional[memoryview] = None
+
+    @staticmethod
+    def create(columns: Dict[str, List[Any]], typecode: str) -> "SharedTable":
+        names = list(columns)
+        rows = len(columns[names[0]]) if names else 0
+        nbytes = array(typecode).itemsize * rows * len(names)
+        shm = SharedMemory(create=True, size=max(1, nbytes))
+
+        table = SharedTable(shm.name, names, rows, typecode)
+        table.shm = shm
+        table.view = shm.buf[:nbytes].cast(typecode)
+        for index, name in enumerate(names):
+            table.view[index * rows:(index + 1) * rows] = array(typecode, columns[name])
+
+        return table
+
+    def attach(self) -> "SharedTable":
+        self.shm = SharedMemory(name=self.name)
+        nbytes = array(self.typecode).itemsize * self.rows * len(self.columns)
+        self.view = self.shm.buf[:nbytes].cast(self.typecode)
+        return self
+
+    def column(self, name: str) -> memoryview:
+        index = self.columns.index(name)
+        return self.view[index * self.rows:(index + 1) * self.rows]
+
+    def close(self, unlink: bool = False) -> None:
+        if self.view is not None:
+            self.view.release()
+            self.view = None
+        if self.shm is not None:
+            self.shm.close()
+            if unlink:
+                self.shm.unlink()
+            self.shm = None
+
+
+class SharedDay:
+    def __init__(self, label: str, symbols: List[str], traders: List[str],
+                 book: SharedTable, trades: SharedTable, observations: SharedTable) -> None:
+        self.label = label
+        self.symbols = symbols
+        self.traders = traders
+        self.book = book
+        self.trades = trades
+        self.observations = observations
+
+    def tables(self) -> List[SharedTable]:
+        return [self.book, self.trades, self.observations]
+
+    def detached(self) -> "SharedDay":
+        # Worker processes get a copy that only knows segment names and shapes,
+        # even under fork where initargs are inherited rather than pickled
+        return SharedDay(self.label, self.symbols, self.traders,
+                         *(SharedTable(table.name, table.columns, table.rows, table.typecode)
+                           for table in self.tables()))
+
+    def attach(self) -> "SharedDay":
+        for table in self.tables():
+            table.attach()
+        return self
+
+    def close(self, unlink: bool = False) -> None:
+        for table in self.tables():
+            table.close(unlink)
+
+
+def parse_number(field: str) -> Any:
+    if not field:
+        return 0
+    try:
+        return int(field)
+    except ValueError:
+        return float(field)
+
+
+def read_rows(path: str) -> List[Dict[str, str]]:
+    with open(path, newline='') as f:
+        delimiter = ';' if ';' in f.readline() else ','
+        f.seek(0)
+        return list(csv.DictReader(f, delimiter=delimiter))
+
+
+def find_companion(prices_path: str, kind: str) -> Optional[str]:
+    # prices_round_3_day_0.csv pairs with trades_round_3_day_0_nn.csv and
+    # observations_round_3_day_0.csv
+    directory, name = os.path.split(prices_path)
+    matches = glob.glob(os.path.join(directory, os.path.splitext(name.replace('prices', kind))[0] + '*.csv'))
+    return sorted(matches)[0] if matches else None
+
+
+def load_day(prices_path: str) -> SharedDay:
+    prices = read_rows(prices_path)
+    prices.sort(key=lambda row: int(row['timestamp']))
+    symbols = sorted({row['product'] for row in prices})
+    symbol_ids = {symbol: index for index, symbol in enumerate(symbols)}
+
+    book = {column: [] for column in BOOK_COLUMNS}
+    for row in prices:
+        book['timestamp'].append(int(row['timestamp']))
+        book['product'].append(symbol_ids[row['product']])
+        for column in BOOK_COLUMNS[2:]:
+            # Missing levels become zero volume, which the replay skips
+            book[column].append(int(parse_number(row.get(column, ''))))
+
+    trades = {column: [] for column in TRADE_COLUMNS}
+    traders: List[str] = []
+    trader_ids: Dict[str, int] = {}
+    trades_path = find_companion(prices_path, 'trades')
+    if trades_path:
+        rows = read_rows(trades_path)
+        rows.sort(key=lambda row: int(row['timestamp']))
+        for row in rows:
+            if row['symbol'] not in symbol_ids:
+                continue
+            trades['timestamp'].append(int(row['timestamp']))
+            trades['symbol'].append(symbol_ids[row['symbol']])
+            trades['price'].append(int(float(row['price'])))
+            trades['quantity'].append(int(row['quantity']))
+            for side in ('buyer', 'seller'):
+                name = row.get(side) or ''
+                if name not in trader_ids:
+                    trader_ids[name] = len(traders)
+                    traders.append(name)
+                trades[side].append(trader_ids[name])
+
+    observations = {column: [] for column in OBSERVATION_COLUMNS}
+    observations_path = find_companion(prices_path, 'observations')
+    if observations_path:
+        for row in sorted(read_rows(observations_path), key=lambda row: int(row['timestamp'])):
+            for column in OBSERVATION_COLUMNS:
+                observations[column].append(float(parse_number(row.get(column, ''))))
+
+    return SharedDay(prices_path, symbols, traders,
+                     SharedTable.create(book, 'q'),
+                     SharedTable.create(trades, 'q'),
+                     SharedTable.create(observations, 'd'))
+
+
+class Exchange:
+    # Fills orders against the visible book of the tick they were sent in and
+    # cancels every order of a product that could breach its position limit,
+    # the same rule the exchange applies.
+    def __init__(self) -> None:
+        self.position: Dict[str, int] = {}
+        self.cash: Dict[str, float] = {}
+        self.mid_prices: Dict[str, float] = {}
+
+    def execute(self, timestamp: int, order_depths: Dict[str, OrderDepth],
+                orders: Dict[str, List[Order]]) -> Dict[str, List[Trade]]:
+        own_trades = {}
+        for symbol, symbol_orders in orders.items():
+            if symbol not in order_depths or not symbol_orders:
+                continue
+
+            position = self.position.get(symbol, 0)
+            limit = POSITION_LIMITS.get(symbol, 0)
+            total_buy = sum(order.quantity for order in symbol_orders if order.quantity > 0)
+            total_sell = -sum(order.quantity for order in symbol_orders if order.quantity < 0)
+            if position + total_buy > limit or position - total_sell < -limit:
+                continue
+
+            order_depth = order_depths[symbol]
+            asks = dict(order_depth.sell_orders)
+            bids = dict(order_depth.buy_orders)
+            trades = []
+            for order in symbol_orders:
+                if order.quantity > 0:
+                    remaining = order.quantity
+                    for price in sorted(asks):
+                        if price > order.price or remaining == 0:
+                            break
+                        volume = min(remaining, -asks[price])
+                        asks[price] += volume
+                        remaining -= volume
+                        trades.append(Trade(symbol, price, volume, 'SUBMISSION', '', timestamp))
+                else:
+                    remaining = -order.quantity
+                    for price in sorted(bids, reverse=True):
+                        if price < order.price or remaining == 0:
+                            break
+                        volume = min(remaining, bids[price])
+                        bids[price] -= volume
+                        remaining -= volume
+                        trades.append(Trade(symbol, price, volume, '', 'SUBMISSION', timestamp))
+
+            for trade in trades:
+                signed = trade.quantity if trade.buyer == 'SUBMISSION' else -trade.quantity
+                self.position[symbol] = self.position.get(symbol, 0) + signed
+                self.cash[symbol] = self.cash.get(symbol, 0.0) - signed * trade.price
+            if trades:
+                own_trades[symbol] = trades
+
+        return own_trades
+
+    def mark(self, order_depths: Dict[str, OrderDepth]) -> None:
+        for symbol, order_depth in order_depths.items():
+            if order_depth.buy_orders and order_depth.sell_orders:
+                self.mid_prices[symbol] = (max(order_depth.buy_orders) + min(order_depth.sell_orders)) / 2
+
+    def pnl(self) -> Dict[str, float]:
+        return {symbol: self.cash.get(symbol, 0.0) + position * self.mid_prices.get(symbol, 0.0)
+                for symbol, position in self.position.items()}
+
+
+def iter_states(day: SharedDay):
+    # Walks the shared columns tick by tick and builds the TradingState inputs
+    # for each timestamp; own trades and traderData are filled in by the caller.
+    book = {column: day.book.column(column) for column in BOOK_COLUMNS}
+    trades = {column: day.trades.column(column) for column in TRADE_COLUMNS}
+    observations = {column: day.observations.column(column) for column in OBSERVATION_COLUMNS}
+    listings = {symbol: {'symbol': symbol, 'product': symbol, 'denomination': 'SEASHELLS'}
+                for symbol in day.symbols}
+
+    timestamps = book['timestamp']
+    row, trade_row, observation_row = 0, 0, -1
+    while row < day.book.rows:
+        timestamp = timestamps[row]
+
+        order_depths = {}
+        while row < day.book.rows and timestamps[row] == timestamp:
+            order_depth = OrderDepth()
+            for level in range(1, BOOK_LEVELS + 1):
+                if book[f'bid_volume_{level}'][row] > 0:
+                    order_depth.buy_orders[book[f'bid_price_{level}'][row]] = book[f'bid_volume_{level}'][row]
+                if book[f'ask_volume_{level}'][row] > 0:
+                    order_depth.sell_orders[book[f'ask_price_{level}'][row]] = -book[f'ask_volume_{level}'][row]
+            order_depths[day.symbols[book['product'][row]]] = order_depth
+            row += 1
+
+        market_trades: Dict[str, List[Trade]] = {}
+        while trade_row < day.trades.rows and trades['timestamp'][trade_row] < timestamp:
+            symbol = day.symbols[trades['symbol'][trade_row]]
+            market_trades.setdefault(symbol, []).append(Trade(
+                symbol, trades['price'][trade_row], trades['quantity'][trade_row],
+                day.traders[trades['buyer'][trade_row]], day.traders[trades['seller'][trade_row]],
+                trades['timestamp'][trade_row]))
+            trade_row += 1
+
+        while observation_row + 1 < day.observations.rows and observations['timestamp'][observation_row + 1] <= timestamp:
+            observation_row += 1
+        conversion_observations = {}
+        if observation_row >= 0:
+            conversion_observations['ORCHIDS'] = ConversionObservation(
+                *(observations[column][observation_row] for column in OBSERVATION_COLUMNS[1:]))
+
+        yield timestamp, listings, order_depths, market_trades, Observation({}, conversion_observations)
+
+
+def replay_day(module_name: str, day: SharedDay, recorder: Any = None) -> Dict[str, Any]:
+    module = importlib.import_module(module_name)
+    trader = module.Trader()
+    exchange = Exchange()
+    own_trades: Dict[str, List[Trade]] = {}
+    trader_data = ''
+    ticks = 0
+
+    # Trader modules print one Logger.flush line per tick; discard them
+    with redirect_stdout(io.StringIO()) as sink:
+        for timestamp, listings, order_depths, market_trades, observations in iter_states(day):
+            position = {symbol: quantity for symbol, quantity in exchange.position.items() if quantity != 0}
+            state = TradingState(trader_data, timestamp, listings, order_depths, own_trades,
+                                 market_trades, position, observations)
+            if recorder is not None:
+                recorder.before_run(state, trader)
+            orders, conversions, trader_data = trader.run(state)
+            if recorder is not None:
+                recorder.after_run(orders, conversions, trader_data)
+            own_trades = exchange.execute(timestamp, order_depths, orders)
+            exchange.mark(order_depths)
+            ticks += 1
+            sink.seek(0)
+            sink.truncate()
+
+    pnl = exchange.pnl()
+    return {'pnl': pnl, 'total': sum(pnl.values()), 'ticks': ticks}
+
+
+_shared_days: Dict[str, SharedDay] = {}
+
+
+def attach_days(days: List[SharedDay]) -> None:
+    for day in days:
+        _shared_days[day.label] = day.attach()
+
+
+def run_job(module_name: str, label: str) -> Dict[str, Any]:
+    start = time.perf_counter()
+    result = {'module': module_name, 'day': label, 'pnl': {}, 'total': 0.0, 'ticks': 0, 'error': None}
+    try:
+        result.update(replay_day(module_name, _shared_days[label]))
+    except Exception as e:
+        result['error'] = f'{type(e).__name__}: {e}'
+    result['seconds'] = time.perf_counter() - start
+    return result
+
+
+def replay(modules: List[str], prices_paths: List[str], processes: Optional[int] = None) -> List[Dict[str, Any]]:
+    # Days are keyed by their path in the workers, so the same file twice would collide
+    if len(set(map(os.path.abspath, prices_paths))) != len(prices_paths):
+        raise ValueError('the same day was given more than once')
+    days = [load_day(path) for path in prices_paths]
+    try:
+        jobs: List[Tuple[str, str]] = [(module, day.label) for module in modules for day in days]
+        with Pool(processes, initializer=attach_days, initargs=([day.detached() for day in days],)) as pool:
+            return pool.starmap(run_job, jobs, chunksize=1)
+    finally:
+        for day in days:
+            day.close(unlink=True)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 3:
+        print("Usage: python replay.py <module[,module...]> <prices_round_X_day_Y.csv>... [-j processes]")
+        sys.exit(1)
+
+    args = sys.argv[1:]
+    processes = None
+    if '-j' in args:
+        index = args.index('-j')
+        processes = int(args[index + 1])
+        del args[index:index + 2]
+
+    start = time.perf_counter()
+    results = replay(args[0].split(','), args[1:], processes)
+
+    print(f"{'module':<20} {'day':<40} {'ticks':>7} {'pnl':>12} {'seconds':>8}")
+    for result in results:
+        print(f"{result['module']:<20} {result['day']:<40} {result['ticks']:>7} "
+              f"{result['total']:>12.1f} {result['seconds']:>8.2f}" +
+              (f"  {result['error']}" if result['error'] else ''))
+    print(f"total {time.perf_counter() - start:.2f}s")
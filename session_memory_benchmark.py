@@ -0,0 +1,43 @@
+import os
+import sys
+import time
+from contextlib import redirect_stdout
+
+from synthetic_states import StateGenerator
+
+
+def rss_bytes() -> int:
+    # Current (not peak) resident set size, so growth shows up as it happens
+    with open('/proc/self/statm') as f:
+        return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+
+
+def run_session(module_name: str, ticks: int, samples: int = 10) -> None:
+    module = __import__(module_name)
+    trader = module.Trader()
+    generator = StateGenerator(seed=0)
+    trader_data = ""
+    every = max(1, ticks // samples)
+
+    print(f"{'tick':>10} {'rss MB':>10} {'ticks/s':>10}")
+    start = last = time.perf_counter()
+    with open(os.devnull, 'w') as devnull:
+        for tick in range(1, ticks + 1):
+            with redirect_stdout(devnull):
+                _, _, trader_data = trader.run(generator.next_state(trader_data))
+            if tick % every == 0:
+                now = time.perf_counter()
+                print(f"{tick:>10} {rss_bytes() / 2 ** 20:>10.1f} {every / (now - last):>10.0f}")
+                last = now
+
+    print(f"{ticks} ticks in {time.perf_counter() - start:.1f}s")
+    if hasattr(trader, 'session_memory'):
+        print("memory per Trader field:")
+        for name, size in sorted(trader.session_memory.report(trader).items(), key=lambda item: -item[1]):
+            print(f"  {name:<24} {size / 1024:>10.1f} KiB")
+
+
+if __name__ == "__main__":
+    ticks = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    module_name = sys.argv[2] if len(sys.argv) > 2 else 'r3_mm_etf_hedging'
+    run_session(module_name, ticks)
@@ -0,0 +1,68 @@
+import json
+import statistics
+import subprocess
+import sys
+from typing import Dict, List
+
+TRADER_MODULES = ['sample_trader', 'r3_ls', 'r3_mm_etf_hedging']
+
+# Runs in a fresh interpreter and times the trader import before anything else
+# is loaded, so "import" includes datamodel and the stdlib modules both pull in.
+# The first state is built from datamodel alone once the import is measured.
+CHILD_SCRIPT = '''
+import sys, time
+start = time.perf_counter()
+module = __import__(sys.argv[1])
+imported = time.perf_counter()
+
+from datamodel import ConversionObservation, Observation, OrderDepth, TradingState
+mid_prices = {'AMETHYSTS': 10000, 'STARFRUIT': 5000, 'ORCHIDS': 1100, 'CHOCOLATE': 7900,
+              'STRAWBERRIES': 4000, 'ROSES': 14500, 'GIFT_BASKET': 70475}
+order_depths = {}
+for product, mid_price in mid_prices.items():
+    order_depth = OrderDepth()
+    order_depth.buy_orders = {mid_price - 2: 10, mid_price - 3: 20}
+    order_depth.sell_orders = {mid_price + 2: -10, mid_price + 3: -20}
+    order_depths[product] = order_depth
+listings = {product: {"symbol": product, "product": product, "denomination": "SEASHELLS"} for product in mid_prices}
+observations = Observation({}, {'ORCHIDS': ConversionObservation(1098.5, 1101.5, 1.0, 9.5, -5.0, 2500.0, 70.0)})
+state = TradingState("", 0, listings, order_depths, {}, {}, {product: 0 for product in mid_prices}, observations)
+
+import io
+from contextlib import redirect_stdout
+constructing = time.perf_counter()
+trader = module.Trader()
+constructed = time.perf_counter()
+with redirect_stdout(io.StringIO()):
+    trader.run(state)
+ran = time.perf_counter()
+
+import json
+print(json.dumps({"import": imported - start, "construct": constructed - constructing, "first_run": ran - constructed}))
+'''
+
+
+def run_child(script: str, module: str) -> Dict[str, float]:
+    output = subprocess.run([sys.executable, '-c', script, module], check=True,
+                            capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def benchmark(module: str, repeats: int) -> Dict[str, float]:
+    samples: Dict[str, List[float]] = {}
+    for _ in range(repeats):
+        for name, seconds in run_child(CHILD_SCRIPT, module).items():
+            samples.setdefault(name, []).append(seconds)
+
+    return {name: statistics.median(values) for name, values in samples.items()}
+
+
+if __name__ == "__main__":
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    modules = sys.argv[2:] or TRADER_MODULES
+
+    print(f"{'module':<20} {'import':>10} {'Trader()':>10} {'first run':>10}  (median ms of {repeats})")
+    for module in modules:
+        result = benchmark(module, repeats)
+        print(f"{module:<20} {result['import'] * 1000:>10.2f} "
+              f"{result['construct'] * 1000:>10.2f} {result['first_run'] * 1000:>10.2f}")
@@ -0,0 +1,94 @@
+import random
+from typing import Dict, Iterator, List
+
+from datamodel import ConversionObservation, Observation, OrderDepth, Trade, TradingState
+from position_limits import POSITION_LIMITS
+
+
+START_PRICES = {
+    'AMETHYSTS': 10000,
+    'STARFRUIT': 5000,
+    'ORCHIDS': 1100,
+    'CHOCOLATE': 7900,
+    'STRAWBERRIES': 4000,
+    'ROSES': 14500,
+    'GIFT_BASKET': 70475,
+}
+
+COUNTERPARTIES = ['Adam', 'Amelia', 'Raj', 'Remy', 'Rhianna', 'Ruby', 'Valentina', 'Vinnie', 'Vladimir']
+
+
+class StateGenerator:
+    # Produces a reproducible stream of TradingState objects shaped like the
+    # exchange's: a few book levels per product around a random-walk mid, market
+    # trades between named counterparties, own trades matching the random-walk
+    # position changes, and ORCHIDS conversion observations.
+    def __init__(self, seed: int = 0, tick: int = 100) -> None:
+        self.rng = random.Random(seed)
+        self.tick = tick
+        self.timestamp = 0
+        self.mid_prices = dict(START_PRICES)
+        self.position = {product: 0 for product in START_PRICES}
+        self.sunlight = 2500.0
+        self.humidity = 70.0
+
+    def make_order_depth(self, mid_price: int) -> OrderDepth:
+        order_depth = OrderDepth()
+        half_spread = self.rng.randint(1, 3)
+        for level in range(self.rng.randint(1, 3)):
+            order_depth.buy_orders[mid_price - half_spread - level] = self.rng.randint(1, 30)
+            order_depth.sell_orders[mid_price + half_spread + level] = -self.rng.randint(1, 30)
+
+        return order_depth
+
+    def make_market_trades(self) -> Dict[str, List[Trade]]:
+        market_trades = {}
+        for product, mid_price in self.mid_prices.items():
+            if self.rng.random() < 0.3:
+                buyer, seller = self.rng.sample(COUNTERPARTIES, 2)
+                price = mid_price + self.rng.randint(-2, 2)
+                market_trades[product] = [Trade(product, price, self.rng.randint(1, 10),
+                                                buyer, seller, self.timestamp - self.tick)]
+
+        return market_trades
+
+    def make_own_trade(self, product: str, quantity: int) -> Trade:
+        # Fills land on our side of the previous tick's book, against a named counterparty
+        counterparty = self.rng.choice(COUNTERPARTIES)
+        if quantity > 0:
+            return Trade(product, self.mid_prices[product] - 1, quantity, 'SUBMISSION', counterparty,
+                         self.timestamp - self.tick)
+        return Trade(product, self.mid_prices[product] + 1, -quantity, counterparty, 'SUBMISSION',
+                     self.timestamp - self.tick)
+
+    def next_state(self, trader_data: str = "") -> TradingState:
+        own_trades = {}
+        for product in self.mid_prices:
+            limit = POSITION_LIMITS[product]
+            position = max(-limit, min(limit, self.position[product] + self.rng.randint(-2, 2)))
+            if position != self.position[product] and self.timestamp > 0:
+                own_trades[product] = [self.make_own_trade(product, position - self.position[product])]
+            self.position[product] = position
+            self.mid_prices[product] += self.rng.choice((-1, 0, 0, 1))
+        self.sunlight = max(0.0, self.sunlight + self.rng.uniform(-20, 20))
+        self.humidity = max(0.0, min(100.0, self.humidity + self.rng.uniform(-0.5, 0.5)))
+
+        # The exchange hands listings over as plain dicts, which is what Logger.compress_listings expects
+        listings = {product: {"symbol": product, "product": product, "denomination": "SEASHELLS"}
+                    for product in self.mid_prices}
+        order_depths = {product: self.make_order_depth(mid_price)
+                        for product, mid_price in self.mid_prices.items()}
+        orchids_mid = self.mid_prices['ORCHIDS']
+        observations = Observation({}, {'ORCHIDS': ConversionObservation(
+            orchids_mid - 1.5, orchids_mid + 1.5, 1.0, 9.5, -5.0, self.sunlight, self.humidity)})
+
+        state = TradingState(trader_data, self.timestamp, listings, order_depths, own_trades,
+                             self.make_market_trades(), dict(self.position), observations)
+        self.timestamp += self.tick
+        return state
+
+
+def generate_states(count: int, seed: int = 0) -> Iterator[TradingState]:
+    generator = StateGenerator(seed)
+    for _ in range(count):
+        yield generator.next_state()
@@ -0,0 +1,70 @@
+from datamodel import Observation, Order, OrderDepth, TradingState
+from r3_mm_etf_hedging import BasketHedger
+
+
+LIMITS = {'CHOCOLATE': 250, 'STRAWBERRIES': 350, 'ROSES': 60, 'GIFT_BASKET': 60}
+
+
+def make_state(position):
+    order_depths = {}
+    for product, mid_price in (('CHOCOLATE', 7900), ('STRAWBERRIES', 4000), ('ROSES', 14500)):
+        order_depth = OrderDepth()
+        order_depth.buy_orders = {mid_price - 1: 20, mid_price - 2: 30}
+        order_depth.sell_orders = {mid_price + 1: -20, mid_price + 2: -30}
+        order_depths[product] = order_depth
+
+    return TradingState("", 0, {}, order_depths, {}, {}, position, Observation({}, {}))
+
+
+def make_hedger():
+    return BasketHedger({'GIFT_BASKET': {'CHOCOLATE': 4, 'STRAWBERRIES': 6, 'ROSES': 1}}, LIMITS)
+
+
+def volume(orders):
+    return sum(order.quantity for order in orders)
+
+
+def test_hedges_basket_exposure():
+    # Long 5 baskets is long 5 ROSES through the basket, so 5 are sold into the bid
+    hedged = make_hedger().hedge(make_state({'GIFT_BASKET': 5}), {})
+
+    assert [(order.price, order.quantity) for order in hedged['ROSES']] == [(14499, -5)]
+    assert volume(hedged['CHOCOLATE']) == -20
+    assert volume(hedged['STRAWBERRIES']) == -30
+
+
+def test_leaves_standalone_inventory_alone():
+    assert make_hedger().hedge(make_state({'ROSES': 10}), {}) == {}
+
+
+def test_marketable_placed_order_counts_towards_hedge():
+    placed = {'ROSES': [Order('ROSES', 14499, -3)]}
+    hedged = make_hedger().hedge(make_state({'GIFT_BASKET': 5}), placed)
+
+    assert volume(hedged['ROSES']) == -5
+
+
+def test_passive_placed_order_does_not_count_towards_hedge():
+    # A resting ask above the best bid may never fill, so the full exposure is
+    # still sold into the bid and the passive order is kept on top of it
+    placed = {'ROSES': [Order('ROSES', 14505, -3)]}
+    hedged = make_hedger().hedge(make_state({'GIFT_BASKET': 5}), placed)
+
+    assert hedged['ROSES'][0] is placed['ROSES'][0]
+    assert volume(hedged['ROSES'][1:]) == -5
+
+
+def test_passive_placed_order_still_uses_limit_room():
+    # ROSES is at -50 against a limit of 60, and a resting ask for 8 leaves room for 2
+    placed = {'ROSES': [Order('ROSES', 14505, -8)]}
+    hedged = make_hedger().hedge(make_state({'GIFT_BASKET': 60, 'ROSES': -50}), placed)
+
+    assert volume(hedged['ROSES'][1:]) == -2
+
+
+def test_drops_opposite_side_orders():
+    placed = {'ROSES': [Order('ROSES', 14499, 4), Order('ROSES', 14499, -2)]}
+    hedged = make_hedger().hedge(make_state({'GIFT_BASKET': 5}), placed)
+
+    assert all(order.quantity < 0 for order in hedged['ROSES'])
+    assert volume(hedged['ROSES']) == -5